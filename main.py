@@ -3,9 +3,21 @@ from discord.ext import commands
 import json
 import random
 import os
+import datetime
 from dotenv import load_dotenv
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 import io
+import functools
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import re
+from collections import defaultdict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Load environment variables
 load_dotenv()
@@ -13,13 +25,44 @@ load_dotenv()
 # Bot setup
 intents = discord.Intents.default()
 intents.message_content = True
-intents.members = True
 
 bot = commands.Bot(command_prefix='!', intents=intents, help_command=None)
 
 # Load tarot cards data
-with open('data/tarot_cards.json', 'r', encoding='utf-8') as f:
-    tarot_cards = json.load(f)
+if orjson:
+    with open('data/tarot_cards.json', 'rb') as f:
+        tarot_cards = orjson.loads(f.read())
+else:
+    with open('data/tarot_cards.json', 'r', encoding='utf-8') as f:
+        tarot_cards = json.load(f)
+
+# Precompute derived strings used in every reading
+for c in tarot_cards:
+    c['arcana_title'] = c['arcana'].title()
+    c['suit_title'] = c['suit'].title() if c['suit'] else ''
+    c['keywords_str'] = ', '.join(c['keywords'])
+    c['filename'] = f"{c['number']}_{c['name'].lower().replace(' ', '_')}.jpg"
+
+# Card art available on disk (the files don't change at runtime)
+CARD_IMAGES_DIR = 'card_images'
+AVAILABLE_CARD_IMAGES = set(os.listdir(CARD_IMAGES_DIR)) if os.path.isdir(CARD_IMAGES_DIR) else set()
+
+# Card groupings (the deck never changes after load)
+MAJOR_CARDS = [c for c in tarot_cards if c['arcana'] == 'major']
+MINOR_BY_SUIT = defaultdict(list)
+for c in tarot_cards:
+    if c['arcana'] == 'minor' and c['suit']:
+        MINOR_BY_SUIT[c['suit']].append(c)
+
+# Card name indexes for !card lookups
+CARD_INDEX_EXACT = {c['name'].lower(): c for c in tarot_cards}
+CARD_INDEX_LOWERED = [(c['name'].lower(), c) for c in tarot_cards]
+
+# Random generator for card draws
+RNG = np.random.default_rng()
+
+# Thread pool for blocking PIL rendering
+RENDER_EXECUTOR = ThreadPoolExecutor(max_workers=4)
 
 # Spreading options
 SPREADS = {
@@ -33,79 +76,266 @@ SPREADS = {
 }
 
 class TarotReading:
-    def __init__(self, cards, spread_type, question=None):
+    def __init__(self, cards, orientations, spread_type, question=None):
         self.cards = cards
+        self.orientations = orientations
         self.spread_type = spread_type
         self.question = question
         self.positions = SPREADS.get(spread_type, [])
     
     def generate_reading(self):
         """Generate reading text"""
-        reading = f"## 🔮 Tarot Reading - {self.spread_type.replace('_', ' ').title()}\n"
+        parts = [f"## 🔮 Tarot Reading - {self.spread_type.replace('_', ' ').title()}\n"]
         
         if self.question:
-            reading += f"**Question:** {self.question}\n\n"
+            parts.append(f"**Question:** {self.question}\n\n")
         
         for i, (card, position) in enumerate(zip(self.cards, self.positions)):
-            # Random orientation (upright or reversed)
-            is_reversed = random.choice([True, False])
+            is_reversed = self.orientations[i]
             orientation = "Reversed 🔄" if is_reversed else "Upright ⬆️"
             
-            reading += f"### {position}\n"
-            reading += f"**Card:** {card['name']} ({orientation})\n"
-            reading += f"**Arcana:** {card['arcana'].title()}\n"
+            parts.append(f"### {position}\n")
+            parts.append(f"**Card:** {card['name']} ({orientation})\n")
+            parts.append(f"**Arcana:** {card['arcana_title']}\n")
             
             if card['suit']:
-                reading += f"**Suit:** {card['suit'].title()}\n"
+                parts.append(f"**Suit:** {card['suit_title']}\n")
             
-            reading += f"**Keywords:** {', '.join(card['keywords'])}\n"
+            parts.append(f"**Keywords:** {card['keywords_str']}\n")
             
             if is_reversed:
                 meaning = card['meaning_rev']
             else:
                 meaning = card['meaning_up']
             
-            reading += f"**Interpretation:** {meaning}\n\n"
+            parts.append(f"**Interpretation:** {meaning}\n\n")
         
-        return reading
+        return "".join(parts)
     
     async def create_card_image(self, card, position, is_reversed):
-        """Create an image for a single card"""
+        """Create an image for a single card (a file path or shared PNG bytes)"""
+        # Upright cards with art are sent as the original JPEG; position and
+        # orientation are already listed in the reading embed
+        if not is_reversed and card['filename'] in AVAILABLE_CARD_IMAGES:
+            return os.path.join(CARD_IMAGES_DIR, card['filename'])
+        
+        # Use the pre-generated image library if available
+        rendered_filename = rendered_card_filename(card, position, is_reversed)
+        if rendered_filename in AVAILABLE_RENDERED_IMAGES:
+            return os.path.join(RENDERED_DIR, rendered_filename)
+        
+        # Render off the event loop so gateway I/O keeps flowing
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            RENDER_EXECUTOR, _render_card_image, card['filename'], card['name'], position, is_reversed
+        )
+    
+    async def create_board_image(self):
+        """Create one composite image of the whole spread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            RENDER_EXECUTOR, render_spread_board, self.spread_type, self.cards, self.orientations
+        )
+
+# Pre-generated images (see scripts/prerender_cards.py)
+RENDERED_DIR = 'rendered'
+
+def slug(text):
+    """Make a filename-safe slug"""
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+def rendered_card_filename(card, position, is_reversed):
+    """Filename of the pre-generated image for a card/position/orientation"""
+    return f"{card['number']}_{slug(card['name'])}_{slug(position)}_{int(is_reversed)}.png"
+
+def _fresh_rendered_images():
+    """List pre-generated images that are newer than their card's source art"""
+    if not os.path.isdir(RENDERED_DIR):
+        return set()
+    
+    rendered = set(os.listdir(RENDERED_DIR))
+    fresh = set()
+    for card in tarot_cards:
+        # Cards without art have nothing to go stale against
+        art_mtime = 0
+        if card['filename'] in AVAILABLE_CARD_IMAGES:
+            art_mtime = os.path.getmtime(os.path.join(CARD_IMAGES_DIR, card['filename']))
+        
+        for position in SPREADS['single']:
+            for is_reversed in (False, True):
+                filename = rendered_card_filename(card, position, is_reversed)
+                if filename in rendered and os.path.getmtime(os.path.join(RENDERED_DIR, filename)) >= art_mtime:
+                    fresh.add(filename)
+    return fresh
+
+AVAILABLE_RENDERED_IMAGES = _fresh_rendered_images()
+
+# Resized card art keyed by (filename, is_reversed, size)
+CARD_ART_SIZE = (380, 580)
+_CARD_IMG_CACHE = {}
+
+def _get_base_image(card_filename, is_reversed, size=CARD_ART_SIZE):
+    """Load, resize and orient card art once and keep it in memory"""
+    key = (card_filename, is_reversed, size)
+    img = _CARD_IMG_CACHE.get(key)
+    if img is None:
+        # Only the variants that get pasted are kept (upright full-size art is
+        # sent as the original JPEG), so each one is decoded from source
+        card_path = os.path.join(CARD_IMAGES_DIR, card_filename)
+        img = Image.open(card_path).convert('RGB').resize(size, Image.Resampling.BILINEAR)
+        if is_reversed:
+            img = img.transpose(Image.Transpose.ROTATE_180)
+        _CARD_IMG_CACHE[key] = img
+    return img
+
+def _build_placeholder_frame():
+    """Build the blank outlined frame used for cards without art"""
+    img = Image.new('RGB', (400, 600), color=(30, 30, 40))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([10, 10, 390, 590], outline=(100, 100, 150), width=3)
+    return img
+
+_PLACEHOLDER_FRAME = _build_placeholder_frame()
+
+def _draw_card_image(card_filename, card_name, position, is_reversed):
+    """Draw a labelled 400x600 card image"""
+    if card_filename in AVAILABLE_CARD_IMAGES:
         # Create a blank image
         img = Image.new('RGB', (400, 600), color=(30, 30, 40))
         draw = ImageDraw.Draw(img)
         
         try:
             # Try to load card image
-            card_filename = f"{card['number']}_{card['name'].lower().replace(' ', '_')}.jpg"
-            card_path = os.path.join('card_images', card_filename)
-            
-            if os.path.exists(card_path):
-                card_img = Image.open(card_path)
-                if is_reversed:
-                    card_img = card_img.rotate(180)
-                img.paste(card_img.resize((380, 580)), (10, 10))
-            else:
-                # Draw placeholder if image doesn't exist
-                draw.rectangle([10, 10, 390, 590], outline=(100, 100, 150), width=3)
-                draw.text((200, 300), card['name'], fill=(200, 200, 255), anchor="mm")
+            img.paste(_get_base_image(card_filename, is_reversed), (10, 10))
         except:
             pass
-        
-        # Add position label
-        draw.rectangle([0, 550, 400, 600], fill=(50, 50, 70))
-        draw.text((200, 575), position, fill=(255, 255, 200), anchor="mm")
-        
-        # Add orientation indicator
-        orient_text = "Reversed" if is_reversed else "Upright"
-        draw.text((200, 25), orient_text, fill=(255, 200, 200), anchor="mm")
-        
-        # Convert to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-        
-        return img_bytes
+    else:
+        # Draw placeholder if image doesn't exist
+        img = _PLACEHOLDER_FRAME.copy()
+        draw = ImageDraw.Draw(img)
+        draw.text((200, 300), card_name, fill=(200, 200, 255), anchor="mm")
+    
+    # Add position label
+    draw.rectangle([0, 550, 400, 600], fill=(50, 50, 70))
+    draw.text((200, 575), position, fill=(255, 255, 200), anchor="mm")
+    
+    # Add orientation indicator
+    orient_text = "Reversed" if is_reversed else "Upright"
+    draw.text((200, 25), orient_text, fill=(255, 200, 200), anchor="mm")
+    
+    return img
+
+# One rendered PNG per card, single-spread position and orientation
+@functools.lru_cache(maxsize=len(tarot_cards) * len(SPREADS['single']) * 2)
+def _render_card_image(card_filename, card_name, position, is_reversed):
+    """Render a card image to PNG bytes (cached)"""
+    img = _draw_card_image(card_filename, card_name, position, is_reversed)
+    
+    # Convert to bytes (encoded once; the cached bytes are shared by every reading)
+    img_bytes = io.BytesIO()
+    img.save(img_bytes, format='PNG')
+    
+    return img_bytes.getvalue()
+
+# Composite board layouts: board size and (x, y, rotated) per spread position
+BOARD_TILE_SIZE = (180, 270)
+BOARD_ART_SIZE = (170, 260)
+BOARD_FONT = ImageFont.load_default(size=14)
+BOARD_LAYOUTS = {
+    "three_card": ((600, 310), [(15, 20, False), (210, 20, False), (405, 20, False)]),
+    "celtic_cross": ((1600, 1200), [
+        (430, 465, False),   # 1. Present
+        (385, 510, True),    # 2. Challenge (crossing the present)
+        (190, 465, False),   # 3. Past
+        (670, 465, False),   # 4. Future
+        (430, 175, False),   # 5. Above
+        (430, 755, False),   # 6. Below
+        (1200, 906, False),  # 7. Advice
+        (1200, 612, False),  # 8. External
+        (1200, 318, False),  # 9. Hopes/Fears
+        (1200, 24, False),   # 10. Outcome
+    ]),
+    "relationship": ((390, 580), [(10, 10, False), (200, 10, False), (10, 300, False), (200, 300, False)]),
+    "career": ((390, 580), [(10, 10, False), (200, 10, False), (10, 300, False), (200, 300, False)]),
+}
+
+def _draw_board_tile(card, position, is_reversed):
+    """Draw a labelled card tile at board scale"""
+    width, height = BOARD_TILE_SIZE
+    img = Image.new('RGB', BOARD_TILE_SIZE, color=(30, 30, 40))
+    draw = ImageDraw.Draw(img)
+    
+    if card['filename'] in AVAILABLE_CARD_IMAGES:
+        try:
+            img.paste(_get_base_image(card['filename'], is_reversed, BOARD_ART_SIZE), (5, 5))
+        except:
+            pass
+    else:
+        # Draw placeholder if image doesn't exist
+        draw.rectangle([5, 5, width - 5, height - 5], outline=(100, 100, 150), width=2)
+        draw.text((width // 2, height // 2), card['name'], fill=(200, 200, 255), anchor="mm", font=BOARD_FONT)
+    
+    # Add position label
+    draw.rectangle([0, height - 24, width, height], fill=(50, 50, 70))
+    draw.text((width // 2, height - 12), position, fill=(255, 255, 200), anchor="mm", font=BOARD_FONT)
+    
+    # Add orientation indicator
+    orient_text = "Reversed" if is_reversed else "Upright"
+    draw.text((width // 2, 14), orient_text, fill=(255, 200, 200), anchor="mm", font=BOARD_FONT)
+    
+    return img
+
+def render_spread_board(spread_type, cards, orientations):
+    """Render a whole spread as one composite PNG"""
+    (width, height), layout = BOARD_LAYOUTS[spread_type]
+    board = Image.new('RGB', (width, height), color=(20, 20, 30))
+    
+    for card, position, is_reversed, (x, y, rotated) in zip(cards, SPREADS[spread_type], orientations, layout):
+        tile = _draw_board_tile(card, position, is_reversed)
+        if rotated:
+            tile = tile.transpose(Image.Transpose.ROTATE_90)
+        board.paste(tile, (x, y))
+    
+    img_bytes = io.BytesIO()
+    board.save(img_bytes, format='PNG', optimize=False, compress_level=1)
+    
+    return img_bytes.getvalue()
+
+def servable_card_images():
+    """Yield the (card, position, is_reversed) images create_card_image can render
+    
+    Multi-card spreads are sent as a board and upright cards with art as the
+    original JPEG, so only single-spread reversed or missing-art cards remain.
+    """
+    for card in tarot_cards:
+        for position in SPREADS['single']:
+            for is_reversed in (False, True):
+                if is_reversed or card['filename'] not in AVAILABLE_CARD_IMAGES:
+                    yield card, position, is_reversed
+
+def prewarm_card_images(keys):
+    """Render the given (card, position, is_reversed) images into the cache"""
+    for card, position, is_reversed in keys:
+        _render_card_image(card['filename'], card['name'], position, is_reversed)
+
+def _report_prewarm_failure(future):
+    """Log an exception raised by the background prewarm"""
+    if not future.cancelled() and future.exception():
+        print(f"❌ Card image prewarm failed: {future.exception()!r}")
+
+@bot.event
+async def setup_hook():
+    # Pre-render card images the rendered/ library doesn't already cover, in
+    # the background (once, not on every reconnect)
+    keys = [
+        (card, position, is_reversed)
+        for card, position, is_reversed in servable_card_images()
+        if rendered_card_filename(card, position, is_reversed) not in AVAILABLE_RENDERED_IMAGES
+    ]
+    if keys:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(RENDER_EXECUTOR, prewarm_card_images, keys)
+        future.add_done_callback(_report_prewarm_failure)
 
 @bot.event
 async def on_ready():
@@ -119,37 +349,44 @@ async def on_ready():
     )
     await bot.change_presence(activity=activity)
 
+def _build_spreads_embed():
+    """Build the available spreads embed"""
+    embed = discord.Embed(
+        title="🔮 Available Tarot Spreads",
+        description="Choose a spread type:",
+        color=discord.Color.purple()
+    )
+    
+    for spread, positions in SPREADS.items():
+        embed.add_field(
+            name=spread.replace('_', ' ').title(),
+            value=f"{len(positions)} cards\n`!tarot {spread} [question]`",
+            inline=True
+        )
+    
+    return embed
+
+_SPREADS_EMBED = _build_spreads_embed()
+
 @bot.command(name='tarot')
 async def tarot_reading(ctx, spread_type="single", *, question=None):
     """Draw tarot cards for a reading"""
     
     if spread_type not in SPREADS:
         # Show available spreads
-        embed = discord.Embed(
-            title="🔮 Available Tarot Spreads",
-            description="Choose a spread type:",
-            color=discord.Color.purple()
-        )
-        
-        for spread, positions in SPREADS.items():
-            embed.add_field(
-                name=spread.replace('_', ' ').title(),
-                value=f"{len(positions)} cards\n`!tarot {spread} [question]`",
-                inline=True
-            )
-        
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_SPREADS_EMBED)
         return
     
     # Get number of cards needed
     num_cards = len(SPREADS[spread_type])
     
     # Draw random cards
-    drawn_cards = random.sample(tarot_cards, num_cards)
-    orientations = [random.choice([True, False]) for _ in range(num_cards)]
+    idx = RNG.choice(len(tarot_cards), size=num_cards, replace=False)
+    drawn_cards = [tarot_cards[i] for i in idx]
+    orientations = RNG.integers(0, 2, size=num_cards, dtype=bool).tolist()
     
     # Create reading
-    reading = TarotReading(drawn_cards, spread_type, question)
+    reading = TarotReading(drawn_cards, orientations, spread_type, question)
     reading_text = reading.generate_reading()
     
     # Create embed
@@ -166,11 +403,19 @@ async def tarot_reading(ctx, spread_type="single", *, question=None):
     
     await ctx.send(embed=embed)
     
-    # Send card images
-    for i, (card, position) in enumerate(zip(drawn_cards, SPREADS[spread_type])):
-        img_bytes = await reading.create_card_image(card, position, orientations[i])
-        file = discord.File(img_bytes, filename=f"card_{i+1}.png")
-        await ctx.send(file=file)
+    # Multi-card spreads are sent as a single board image
+    if spread_type in BOARD_LAYOUTS:
+        board_bytes = await reading.create_board_image()
+        await ctx.send(file=discord.File(io.BytesIO(board_bytes), filename=f"{spread_type}.png"))
+        return
+    
+    # Single-card spreads send the card image itself
+    img = await reading.create_card_image(drawn_cards[0], SPREADS[spread_type][0], orientations[0])
+    if isinstance(img, bytes):
+        file = discord.File(io.BytesIO(img), filename="card_1.png")
+    else:
+        file = discord.File(img, filename=f"card_1{os.path.splitext(img)[1]}")
+    await ctx.send(file=file)
 
 @bot.command(name='card')
 async def single_card(ctx, *, card_name=None):
@@ -181,8 +426,9 @@ async def single_card(ctx, *, card_name=None):
         card = random.choice(tarot_cards)
     else:
         # Find card by name (case-insensitive)
-        card = next((c for c in tarot_cards 
-                    if card_name.lower() in c['name'].lower()), None)
+        query = card_name.lower()
+        card = CARD_INDEX_EXACT.get(query) or next(
+            (c for name, c in CARD_INDEX_LOWERED if query in name), None)
         
         if not card:
             await ctx.send(f"❌ Card '{card_name}' not found. Try `!cards` to see all cards.")
@@ -195,12 +441,12 @@ async def single_card(ctx, *, card_name=None):
     )
     
     embed.add_field(name="Number", value=card['number'], inline=True)
-    embed.add_field(name="Arcana", value=card['arcana'].title(), inline=True)
+    embed.add_field(name="Arcana", value=card['arcana_title'], inline=True)
     
     if card['suit']:
-        embed.add_field(name="Suit", value=card['suit'].title(), inline=True)
+        embed.add_field(name="Suit", value=card['suit_title'], inline=True)
     
-    embed.add_field(name="Keywords", value=', '.join(card['keywords']), inline=False)
+    embed.add_field(name="Keywords", value=card['keywords_str'], inline=False)
     embed.add_field(name="Upright Meaning", value=card['meaning_up'], inline=False)
     embed.add_field(name="Reversed Meaning", value=card['meaning_rev'], inline=False)
     
@@ -210,10 +456,8 @@ async def single_card(ctx, *, card_name=None):
     
     # Send card image if available
     try:
-        card_filename = f"{card['number']}_{card['name'].lower().replace(' ', '_')}.jpg"
-        card_path = os.path.join('card_images', card_filename)
-        
-        if os.path.exists(card_path):
+        if card['filename'] in AVAILABLE_CARD_IMAGES:
+            card_path = os.path.join(CARD_IMAGES_DIR, card['filename'])
             file = discord.File(card_path, filename="tarot_card.jpg")
             embed.set_image(url="attachment://tarot_card.jpg")
             await ctx.send(file=file)
@@ -223,9 +467,6 @@ async def single_card(ctx, *, card_name=None):
 @bot.command(name='cards')
 async def list_cards(ctx):
     """List all tarot cards"""
-    major_cards = [c for c in tarot_cards if c['arcana'] == 'major']
-    minor_cards = [c for c in tarot_cards if c['arcana'] == 'minor']
-    
     embed = discord.Embed(
         title="🃏 Tarot Deck Contents",
         color=discord.Color.dark_green()
@@ -233,14 +474,12 @@ async def list_cards(ctx):
     
     embed.add_field(
         name="Major Arcana (22 cards)",
-        value='\n'.join([f"{c['number']}. {c['name']}" for c in major_cards]),
+        value='\n'.join([f"{c['number']}. {c['name']}" for c in MAJOR_CARDS]),
         inline=True
     )
     
     # Group minor cards by suit
-    suits = set(c['suit'] for c in minor_cards if c['suit'])
-    for suit in suits:
-        suit_cards = [c for c in minor_cards if c['suit'] == suit]
+    for suit, suit_cards in MINOR_BY_SUIT.items():
         embed.add_field(
             name=f"{suit.title()} (14 cards)",
             value='\n'.join([f"{c['name']}" for c in suit_cards[:10]]),
@@ -250,11 +489,11 @@ async def list_cards(ctx):
     embed.set_footer(text=f"Total: {len(tarot_cards)} cards")
     await ctx.send(embed=embed)
 
-@bot.command(name='daily')
-async def daily_draw(ctx):
-    """Get your daily tarot card"""
-    card = random.choice(tarot_cards)
-    is_reversed = random.choice([True, False])
+def _build_daily_embed(day):
+    """Build the daily card embed (same card for everyone on a given UTC date)"""
+    r = random.Random(int(day.strftime('%Y%m%d')))
+    card = r.choice(tarot_cards)
+    is_reversed = r.choice([True, False])
     
     meaning = card['meaning_rev'] if is_reversed else card['meaning_up']
     orientation = "Reversed 🔄" if is_reversed else "Upright ⬆️"
@@ -266,7 +505,7 @@ async def daily_draw(ctx):
     )
     
     embed.add_field(name="Message for Today", value=meaning, inline=False)
-    embed.add_field(name="Keywords", value=', '.join(card['keywords']), inline=False)
+    embed.add_field(name="Keywords", value=card['keywords_str'], inline=False)
     
     if is_reversed:
         advice = "This card reversed suggests you may need to reconsider this area of your life."
@@ -274,13 +513,28 @@ async def daily_draw(ctx):
         advice = "This card upright is a positive sign. Embrace its energy today."
     
     embed.add_field(name="Advice", value=advice, inline=False)
+    
+    return embed
+
+# Daily embed for the current UTC date
+_DAILY_EMBEDS = {}
+
+@bot.command(name='daily')
+async def daily_draw(ctx):
+    """Get your daily tarot card"""
+    today = datetime.datetime.now(datetime.timezone.utc).date()
+    base_embed = _DAILY_EMBEDS.get(today)
+    if base_embed is None:
+        _DAILY_EMBEDS.clear()
+        base_embed = _DAILY_EMBEDS[today] = _build_daily_embed(today)
+    
+    embed = discord.Embed.from_dict(base_embed.to_dict())
     embed.set_footer(text=f"For {ctx.author.display_name}")
     
     await ctx.send(embed=embed)
 
-@bot.command(name='help')
-async def bot_help(ctx):
-    """Show help menu"""
+def _build_help_embed():
+    """Build the help menu embed"""
     embed = discord.Embed(
         title="🔮 Tarot Reading Bot - Help Guide",
         description="A spiritual guide to your questions through tarot cards",
@@ -307,7 +561,14 @@ async def bot_help(ctx):
     
     embed.set_footer(text="Remember: Tarot is a guide, not destiny. Trust your intuition.")
     
-    await ctx.send(embed=embed)
+    return embed
+
+_HELP_EMBED = _build_help_embed()
+
+@bot.command(name='help')
+async def bot_help(ctx):
+    """Show help menu"""
+    await ctx.send(embed=_HELP_EMBED)
 
 # Error handling
 @bot.event
@@ -0,0 +1,41 @@
+"""Pre-generate every card image the bot can send.
+
+Writes one PNG per image the bot can render for a single-card reading
+(reversed cards and cards without art) into rendered/, which the bot sends
+as-is instead of rendering with PIL per reading.
+
+Rerun this whenever card_images/ or the card rendering code in main.py
+changes. The bot ignores a pre-generated image that is older than its
+card's source JPEG, but it cannot tell when the rendering code changed.
+
+Run from the project root:
+    python scripts/prerender_cards.py
+
+For faster rendering, build Pillow against libjpeg-turbo or install
+pillow-simd in place of Pillow:
+    pip uninstall pillow
+    CC="cc -mavx2" pip install -U --force-reinstall pillow-simd
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import RENDERED_DIR, rendered_card_filename, servable_card_images, _render_card_image
+
+
+def main():
+    os.makedirs(RENDERED_DIR, exist_ok=True)
+    
+    count = 0
+    for card, position, is_reversed in servable_card_images():
+        png_bytes = _render_card_image(card['filename'], card['name'], position, is_reversed)
+        with open(os.path.join(RENDERED_DIR, rendered_card_filename(card, position, is_reversed)), 'wb') as f:
+            f.write(png_bytes)
+        count += 1
+    
+    print(f"✅ Rendered {count} card images to {RENDERED_DIR}/")
+
+
+if __name__ == "__main__":
+    main()